@@ -0,0 +1,36 @@
+"""
+JSON helpers for the hot paths (realtime websocket events, parsing stored
+core memories).
+
+Uses orjson when it is installed and the stdlib json module otherwise. The
+parsed values are the same either way, but the serialized text is not: orjson
+writes compact JSON with non-ASCII characters unescaped. Use the stdlib
+json.dumps for anything that must keep a fixed, ASCII-only format (e.g. data
+written to profile files).
+"""
+
+import json
+
+
+try:
+    import orjson
+except ImportError:  # optional speedup, not in requirements.txt
+    orjson = None
+
+
+if orjson is not None:
+
+    def dumps(obj) -> str:
+        """Serialize ``obj`` to a JSON str (compact separators with orjson).
+
+        Returns str, not bytes: websockets sends bytes as binary frames, and the
+        realtime APIs expect their JSON events as text frames.
+        """
+        return orjson.dumps(obj).decode()
+
+    # Accepts str or bytes. orjson's errors subclass TypeError and
+    # json.JSONDecodeError, so callers' except clauses cover both backends.
+    loads = orjson.loads
+else:
+    dumps = json.dumps
+    loads = json.loads
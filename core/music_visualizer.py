@@ -1,4 +1,7 @@
 # billy/music_visualizer.py
+import os
+import random
+import sys
 import time
 import threading
 from dataclasses import dataclass
@@ -6,6 +9,16 @@ from typing import Callable, Optional
 import subprocess
 
 import numpy as np
+from scipy.fft import rfft
+try:
+    import pyfftw
+except ImportError:  # optional speedup; scipy's pocketfft is used instead
+    pyfftw = None
+try:
+    from numba import njit
+except ImportError:  # optional speedup; the kernel runs as plain Python
+    def njit(*args, **kwargs):
+        return lambda fn: fn
 try:
     from .movements import move_tail, move_head, move_mouth, stop_mouth
     from .logger import logger
@@ -15,7 +28,7 @@ except: #For standalone debugging
     logger = logging.getLogger(__name__)
     MOCK_FISH=True
     
-@dataclass
+@dataclass(slots=True)
 class VisualizerConfig:
     # Matches billy.ino FFT length
     audio_samples: int = 2048  # FFT length (bigger = better frequency resolution; 64 was too small for real bass/vocals)
@@ -27,6 +40,12 @@ class VisualizerConfig:
     # Read blocks of 1024 frames for low overhead
     blocksize: int = 1024
 
+    # Optional integer decimation before the FFT (e.g. 3 -> 16kHz). The bands of
+    # interest stop at ~3kHz, so 48kHz is heavily oversampled. audio_samples is the
+    # FFT length at the decimated rate, so pair e.g. decimation=3 with audio_samples=1024.
+    # Note: the absolute *_min_threshold values were tuned for 2048 @ 48kHz.
+    decimation: int = 1
+
     # billy.ino timings
     OPEN_MOUTH_TIME: int = 200
     CLOSE_MOUTH_TIME: int = 100
@@ -88,12 +107,67 @@ class VisualizerConfig:
     bass_min_max_threshold: float = 0.0010
 
 
+    # Niceness for the capture thread on Linux, e.g. -10 for a higher priority
+    # (negative values need CAP_SYS_NICE). None (default) leaves scheduling untouched.
+    thread_nice: Optional[int] = None
+
     # Debug prints (throttled)
     debug: bool = False
     debug_every_s: float = 0.5
 
 
 
+@njit(cache=True, fastmath=True)
+def _band_update(
+    spec, bass_lo, bass_hi, vocal_lo, vocal_hi,
+    bass_env, vocal_env, bass_noise, vocal_noise,
+    bass_scale, vocal_scale, bass_smooth, vocal_smooth,
+    adaptive, noise_smooth, vocal_bleed_cancel,
+):
+    """
+    Per-block numeric kernel: band power -> envelopes -> noise floors -> scores.
+    Takes and returns plain scalars so it JIT-compiles when numba is installed.
+    Returns: (bass_env, vocal_env, bass_noise, vocal_noise, vocal_score, vocal_ratio, bass_ratio)
+    """
+    # Band power sum(|X|^2) straight off the complex spectrum: vdot(c, c) is one
+    # reduction with no sqrt and no intermediate power array.
+    # bass_scale/vocal_scale fold the per-bin normalization and the gains together.
+    bass = spec[bass_lo:bass_hi]
+    vocal = spec[vocal_lo:vocal_hi]
+    bass_e = np.vdot(bass, bass).real * bass_scale
+    vocal_e = np.vdot(vocal, vocal).real * vocal_scale
+
+    # Smooth envelopes
+    bass_env = bass_smooth * bass_env + (1.0 - bass_smooth) * bass_e
+    vocal_env = vocal_smooth * vocal_env + (1.0 - vocal_smooth) * vocal_e
+
+    # During long digital silence the EMAs decay geometrically towards subnormal
+    # floats, which are slow on many CPUs. Flush them to zero well before that;
+    # 1e-20 is far below any usable threshold.
+    if bass_env < 1e-20:
+        bass_env = 0.0
+    if vocal_env < 1e-20:
+        vocal_env = 0.0
+
+    # Update noise floors (adaptive thresholds)
+    # Idea: noise should rise slowly, fall slowly, and not chase peaks too aggressively.
+    # We clamp the update input to avoid noise floor "learning" big transients.
+    if adaptive:
+        bn_in = min(bass_env, bass_noise * 1.5)
+        vn_in = min(vocal_env, vocal_noise * 1.5)
+        bass_noise = noise_smooth * bass_noise + (1.0 - noise_smooth) * max(bn_in, 1e-9)
+        vocal_noise = noise_smooth * vocal_noise + (1.0 - noise_smooth) * max(vn_in, 1e-9)
+
+    # Bass-heavy music can throw lots of harmonics into the "vocal" band.
+    # Suppress mouth false positives by subtracting a small fraction of bass energy
+    # and requiring a minimum vocal/bass ratio.
+    vocal_ratio = vocal_env / (bass_env + 1e-12)
+    vocal_score = max(vocal_env - vocal_bleed_cancel * bass_env, 0.0)
+
+    bass_ratio = bass_env / (vocal_env + 1e-12)
+    return bass_env, vocal_env, bass_noise, vocal_noise, vocal_score, vocal_ratio, bass_ratio
+
+
 class LoopbackArecordReader:
     def __init__(self, frames=1024, rate=48000, channels=2, device="loop_capture"):
         self.frames = frames
@@ -102,6 +176,11 @@ class LoopbackArecordReader:
         self.device = device
         self.proc = None
         self.stop_evt = threading.Event()
+        # Raw PCM block (int16: 2 bytes), filled in place on every read
+        self._buf = bytearray(frames * channels * 2)
+        self._view = memoryview(self._buf)
+        # (frames, channels) int16 view over the same buffer, built once
+        self._pcm = np.frombuffer(self._buf, dtype=np.int16).reshape(frames, channels)
 
     def start(self):
         cmd = [
@@ -127,13 +206,18 @@ class LoopbackArecordReader:
             raise RuntimeError(f"arecord exited immediately (rc={rc}). stderr: {err}")
 
     def read_block(self):
-        # int16: 2 bytes
-        nbytes = self.frames * self.channels * 2
-        buf = self.proc.stdout.read(nbytes)
-        if not buf or len(buf) < nbytes:
-            return None
-        x = np.frombuffer(buf, dtype=np.int16).astype(np.float32) / 32768.0
-        return x.reshape(self.frames, self.channels)
+        # The pipe is unbuffered, so a single read may return less than a block;
+        # keep filling the same buffer instead of dropping the partial data.
+        nbytes = len(self._buf)
+        got = 0
+        while got < nbytes:
+            n = self.proc.stdout.readinto(self._view[got:])
+            if not n:
+                return None  # EOF: arecord went away
+            got += n
+        # Raw int16 view over the reused buffer; scaling to [-1..1] is folded into
+        # the visualizer's FFT window, so no float copy is made here.
+        return self._pcm
 
     def stop(self):
         if self.proc:
@@ -156,6 +240,26 @@ class BillyBassVisualizer:
       work to Billy's motor thread. For now, callbacks can print().
     """
 
+    # Everything below is read on every audio block; slots keep those lookups cheap.
+    __slots__ = (
+        "capture_device", "arecord_device", "cfg",
+        # Motion callbacks
+        "open_mouth", "close_mouth", "flap_head", "flap_tail", "stop_body",
+        # Phase state
+        "talking_phase", "body_phase", "_last_talking_phase", "_last_body_phase",
+        "talking_phase_switch_ts", "body_phase_switch_ts",
+        "max_time_mouth_ts", "max_time_body_ts",
+        # Audio processing
+        "_window", "_ring", "_ring_pos",
+        "_mono", "_scratch", "_spec", "_fft_plan", "_silent_spec",
+        "_decim_lfilter", "_decim_taps", "_decim_zi", "_decim_phase",
+        "_freqs", "_bass_lo", "_bass_hi", "_vocal_lo", "_vocal_hi",
+        "_bass_bins", "_vocal_bins", "_band_bounds", "_band_params", "_silence_energy",
+        "_bass_env", "_vocal_env", "_bass_noise", "_vocal_noise",
+        # Threading / reader / debug
+        "_running", "_thread", "_reader", "_last_debug",
+    )
+
     def __init__(
         self,
         capture_device=None,  # kept for compatibility; not used in arecord mode
@@ -192,18 +296,80 @@ class BillyBassVisualizer:
         self.max_time_body_ts = 0
 
         # Audio processing
-        self._hamming = np.hamming(self.cfg.audio_samples).astype(np.float32)
-
-        # Ring buffer for last N mono samples
-        self._ring = np.zeros(self.cfg.audio_samples, dtype=np.float32)
+        # Hamming window with the int16 -> [-1..1] scaling and the channel average
+        # folded in, so the raw channel sum is converted and windowed in one pass.
+        pcm_scale = 1.0 / (32768.0 * self.cfg.channels)
+        self._window = (np.hamming(self.cfg.audio_samples) * pcm_scale).astype(np.float32)
+
+        # Ring buffer for last N mono samples, stored twice back to back (2N long):
+        # every sample is mirrored at pos and pos + N, so _ring[pos:pos + N] is always
+        # the last N samples oldest -> newest as one flat slice.
+        self._ring = np.zeros(2 * self.cfg.audio_samples, dtype=np.float32)
         self._ring_pos = 0
 
-        # Precompute frequency axis + band masks (rfft bins)
-        self._freqs = np.fft.rfftfreq(self.cfg.audio_samples, d=1.0 / self.cfg.samplerate)
+        # Mono mixdown of one capture block, reused every block
+        self._mono = np.empty(self.cfg.blocksize, dtype=np.float32)
+
+        # Windowed FFT input, reused every block. With pyfftw installed, the FFT is a
+        # plan built once over SIMD-aligned in/out buffers; otherwise scipy's rfft.
+        n = self.cfg.audio_samples
+        if pyfftw is not None:
+            self._scratch = pyfftw.empty_aligned(n, dtype="float32")
+            self._spec = pyfftw.empty_aligned(n // 2 + 1, dtype="complex64")
+            self._fft_plan = pyfftw.FFTW(self._scratch, self._spec, flags=("FFTW_MEASURE",))
+        else:
+            self._scratch = np.empty(n, dtype=np.float32)
+            self._spec = None
+            self._fft_plan = None
+        self._silent_spec = np.zeros(n // 2 + 1, dtype=np.complex64)
+
+        # Anti-alias FIR + state for streaming decimation, only built (and
+        # scipy.signal only imported) when decimation > 1
+        q = self.cfg.decimation
+        if q > 1:
+            from scipy.signal import firwin, lfilter
+
+            self._decim_lfilter = lfilter
+            self._decim_taps = firwin(8 * q + 1, 0.9 / q).astype(np.float32)
+            self._decim_zi = np.zeros(len(self._decim_taps) - 1, dtype=np.float32)
+        else:
+            self._decim_lfilter = self._decim_taps = self._decim_zi = None
+        self._decim_phase = 0
+
+        # Precompute frequency axis + band bin ranges (rfft bins).
+        # rfftfreq is monotonic, so each band is a contiguous [lo:hi) slice.
+        fft_rate = self.cfg.samplerate / q
+        self._freqs = np.fft.rfftfreq(self.cfg.audio_samples, d=1.0 / fft_rate)
         b0, b1 = self.cfg.bass_band_hz
         v0, v1 = self.cfg.vocal_band_hz
-        self._bass_mask = (self._freqs >= b0) & (self._freqs <= b1)
-        self._vocal_mask = (self._freqs >= v0) & (self._freqs <= v1)
+        self._bass_lo = int(np.searchsorted(self._freqs, b0, side="left"))
+        self._bass_hi = int(np.searchsorted(self._freqs, b1, side="right"))
+        self._vocal_lo = int(np.searchsorted(self._freqs, v0, side="left"))
+        self._vocal_hi = int(np.searchsorted(self._freqs, v1, side="right"))
+        self._bass_bins = max(1, self._bass_hi - self._bass_lo)
+        self._vocal_bins = max(1, self._vocal_hi - self._vocal_lo)
+
+        # Constant _band_update arguments, bundled once instead of read from cfg per block.
+        # The bin normalization and gains are folded into one scale per band.
+        self._band_bounds = (self._bass_lo, self._bass_hi, self._vocal_lo, self._vocal_hi)
+        self._band_params = (
+            self.cfg.bass_gain / self._bass_bins,
+            self.cfg.voice_gain / self._vocal_bins,
+            self.cfg.bass_smooth,
+            self.cfg.vocal_smooth,
+            self.cfg.adaptive_thresholds,
+            self.cfg.noise_smooth,
+            self.cfg.vocal_bleed_cancel,
+        )
+
+        # Silence gate. By Parseval, no band's per-bin power can exceed
+        # N * sum((x*w)^2) / bins, so when that bound (times the band gain) is under
+        # half the smallest threshold the FFT can't trigger anything and is skipped.
+        band_scale = max(self.cfg.bass_gain / self._bass_bins, self.cfg.voice_gain / self._vocal_bins)
+        min_thr = min(self.cfg.bass_min_threshold, self.cfg.vocal_min_threshold)
+        self._silence_energy = (
+            0.5 * min_thr / (self.cfg.audio_samples * band_scale) if band_scale > 0 else np.inf
+        )
 
         # Smoothed band energies
         self._bass_env = 0.0
@@ -212,9 +378,8 @@ class BillyBassVisualizer:
         # Adaptive noise floors (initialize small but non-zero)
         self._bass_noise = 1e-6
         self._vocal_noise = 1e-6
-
-        # Threading
-        self._lock = threading.Lock()
+        # Threading. Ring, envelopes and phase state are only ever touched by the
+        # capture thread, so block processing needs no lock.
         self._running = False
         self._thread: Optional[threading.Thread] = None
 
@@ -231,82 +396,88 @@ class BillyBassVisualizer:
         if mono.shape[0] >= self.cfg.audio_samples:
             mono = mono[-self.cfg.audio_samples :]
 
-        for v in mono:
-            self._ring[self._ring_pos] = float(v)
-            self._ring_pos = (self._ring_pos + 1) % self.cfg.audio_samples
-
-    def _ring_snapshot_oldest_to_newest(self) -> np.ndarray:
-        return np.roll(self._ring, -self._ring_pos).astype(np.float32, copy=False)
-
-    def _fft_mag(self, samples: np.ndarray) -> np.ndarray:
-        w = samples * self._hamming
-        spec = np.fft.rfft(w)
-        return np.abs(spec).astype(np.float32)
-
-    def _compute_bass_vocal(self, mag: np.ndarray) -> tuple[float, float, float, float]:
-        # Use power for a more stable "energy" measure
-        power = mag * mag
-
-        bass_e = float(np.sum(power[self._bass_mask]))
-        vocal_e = float(np.sum(power[self._vocal_mask]))
-
-        # Normalize by number of bins so energy doesn't explode when changing FFT size/bands
-        bass_bins = max(1, int(np.count_nonzero(self._bass_mask)))
-        vocal_bins = max(1, int(np.count_nonzero(self._vocal_mask)))
-        bass_e /= bass_bins
-        vocal_e /= vocal_bins
-
-        # Gains (usually leave at 1.0)
-        bass_e *= self.cfg.bass_gain
-        vocal_e *= self.cfg.voice_gain
-
-        # Smooth envelopes
-        self._bass_env = self.cfg.bass_smooth * self._bass_env + (1.0 - self.cfg.bass_smooth) * bass_e
-        self._vocal_env = self.cfg.vocal_smooth * self._vocal_env + (1.0 - self.cfg.vocal_smooth) * vocal_e
-
-        # Update noise floors (adaptive thresholds)
-        # Idea: noise should rise slowly, fall slowly, and not chase peaks too aggressively.
-        # We clamp the update input to avoid noise floor "learning" big transients.
-        if self.cfg.adaptive_thresholds:
-            bn_in = min(self._bass_env, self._bass_noise * 1.5)
-            vn_in = min(self._vocal_env, self._vocal_noise * 1.5)
-            a = self.cfg.noise_smooth
-            self._bass_noise = a * self._bass_noise + (1.0 - a) * max(bn_in, 1e-9)
-            self._vocal_noise = a * self._vocal_noise + (1.0 - a) * max(vn_in, 1e-9)
-
-        # Bass-heavy music can throw lots of harmonics into the "vocal" band.
-        # Suppress mouth false positives by subtracting a small fraction of bass energy
-        # and requiring a minimum vocal/bass ratio.
-        vocal_ratio = self._vocal_env / (self._bass_env + 1e-12)
-        vocal_score = self._vocal_env - (self.cfg.vocal_bleed_cancel * self._bass_env)
-        if vocal_score < 0.0:
-            vocal_score = 0.0
-
-        bass_ratio = self._bass_env / (self._vocal_env + 1e-12)
-        return self._bass_env, vocal_score, vocal_ratio, bass_ratio
+        # Copy in at most two contiguous segments (before/after the wrap point),
+        # each written to both halves of the mirrored ring
+        n = self.cfg.audio_samples
+        pos = self._ring_pos
+        m = mono.shape[0]
+        first = min(m, n - pos)
+        self._ring[pos : pos + first] = mono[:first]
+        self._ring[pos + n : pos + n + first] = mono[:first]
+        rem = m - first
+        if rem:
+            self._ring[:rem] = mono[first:]
+            self._ring[n : n + rem] = mono[first:]
+        self._ring_pos = (pos + m) % n
+
+    def _decimate(self, mono: np.ndarray) -> np.ndarray:
+        # Low-pass with carried filter state, then keep every q-th sample. The phase
+        # tracks where the next kept sample falls, since blocksize needn't divide by q.
+        q = self.cfg.decimation
+        y, self._decim_zi = self._decim_lfilter(
+            self._decim_taps, 1.0, mono, zi=self._decim_zi
+        )
+        out = y[self._decim_phase :: q]
+        self._decim_phase = (self._decim_phase - mono.shape[0]) % q
+        return out
+
+    def _fft_spectrum(self) -> np.ndarray:
+        # The mirrored ring is already oldest -> newest from _ring_pos on
+        samples = self._ring[self._ring_pos : self._ring_pos + self.cfg.audio_samples]
+        np.multiply(samples, self._window, out=self._scratch)
+        # Below the silence gate: let envelopes/noise floors decay on an all-zero spectrum
+        if float(np.dot(self._scratch, self._scratch)) < self._silence_energy:
+            return self._silent_spec
+        if self._fft_plan is not None:
+            self._fft_plan.execute()
+            spec = self._spec
+        else:
+            # scratch is rebuilt every block, so pocketfft may clobber it
+            spec = rfft(self._scratch, overwrite_x=True, workers=1)
+        return spec
+
+    def _compute_bass_vocal(self, spec: np.ndarray) -> tuple[float, float, float, float]:
+        # Power (|X|^2) is a more stable "energy" measure than magnitude.
+        # Normalize by number of bins so energy doesn't explode when changing FFT size/bands,
+        # then apply the gains (usually leave at 1.0).
+        (
+            bass_env, vocal_env, bass_noise, vocal_noise,
+            vocal_score, vocal_ratio, bass_ratio,
+        ) = _band_update(
+            spec, *self._band_bounds,
+            self._bass_env, self._vocal_env, self._bass_noise, self._vocal_noise,
+            *self._band_params,
+        )
+        self._bass_env = float(bass_env)
+        self._vocal_env = float(vocal_env)
+        self._bass_noise = float(bass_noise)
+        self._vocal_noise = float(vocal_noise)
+        return self._bass_env, float(vocal_score), float(vocal_ratio), float(bass_ratio)
 
     def _current_thresholds(self) -> tuple[float, float, float, float]:
         """
         Returns: (bass_thr, bass_max, vocal_thr, vocal_max)
         """
-        if not self.cfg.adaptive_thresholds:
+        cfg = self.cfg
+        if not cfg.adaptive_thresholds:
             # Fallback to fixed thresholds (use min_* values as the fixed values if you want)
             return (
-                self.cfg.bass_min_threshold,
-                self.cfg.bass_min_max_threshold,
-                self.cfg.vocal_min_threshold,
-                self.cfg.vocal_min_max_threshold,
+                cfg.bass_min_threshold,
+                cfg.bass_min_max_threshold,
+                cfg.vocal_min_threshold,
+                cfg.vocal_min_max_threshold,
             )
 
-        bass_thr = max(self.cfg.bass_min_threshold, self._bass_noise * self.cfg.bass_thresh_mult)
-        bass_max = max(self.cfg.bass_min_max_threshold, self._bass_noise * self.cfg.bass_max_mult)
-        vocal_thr = max(self.cfg.vocal_min_threshold, self._vocal_noise * self.cfg.vocal_thresh_mult)
-        vocal_max = max(self.cfg.vocal_min_max_threshold, self._vocal_noise * self.cfg.vocal_max_mult)
+        bass_thr = max(cfg.bass_min_threshold, self._bass_noise * cfg.bass_thresh_mult)
+        bass_max = max(cfg.bass_min_max_threshold, self._bass_noise * cfg.bass_max_mult)
+        vocal_thr = max(cfg.vocal_min_threshold, self._vocal_noise * cfg.vocal_thresh_mult)
+        vocal_max = max(cfg.vocal_min_max_threshold, self._vocal_noise * cfg.vocal_max_mult)
         return bass_thr, bass_max, vocal_thr, vocal_max
  
     # ----- Phase machines (same behavior as billy.ino) -----
 
     def _talk_loop(self, t: int) -> None:
+        cfg = self.cfg
         if self.talking_phase == 0:
             self._last_talking_phase = 0
             return
@@ -321,15 +492,16 @@ class BillyBassVisualizer:
 
         # Timed transitions
         if self.talking_phase == 1:
-            if self.talking_phase_switch_ts + self.cfg.OPEN_MOUTH_TIME <= t:
+            if self.talking_phase_switch_ts + cfg.OPEN_MOUTH_TIME <= t:
                 self.talking_phase = 2
                 self.talking_phase_switch_ts = t
         elif self.talking_phase == 2:
-            if self.talking_phase_switch_ts + self.cfg.CLOSE_MOUTH_TIME <= t:
+            if self.talking_phase_switch_ts + cfg.CLOSE_MOUTH_TIME <= t:
                 self.talking_phase = 0
                 self.talking_phase_switch_ts = t
 
     def _move_loop(self, t: int) -> None:
+        cfg = self.cfg
         if self.body_phase == 0:
             self._last_body_phase = 0
             return
@@ -344,52 +516,54 @@ class BillyBassVisualizer:
             self._last_body_phase = self.body_phase
 
         if self.body_phase == 1:
-            if self.body_phase_switch_ts + self.cfg.FORWARD_BODY_TIME <= t:
+            if self.body_phase_switch_ts + cfg.FORWARD_BODY_TIME <= t:
                 self.body_phase = 2
                 self.body_phase_switch_ts = t
         elif self.body_phase == 2:
-            if self.body_phase_switch_ts + self.cfg.BACKWARD_BODY_TIME <= t:
+            if self.body_phase_switch_ts + cfg.BACKWARD_BODY_TIME <= t:
                 self.body_phase = 0
                 self.body_phase_switch_ts = t
         elif self.body_phase == 3:
-            if self.body_phase_switch_ts + self.cfg.FORWARD_BODY_TIME <= t:
+            if self.body_phase_switch_ts + cfg.FORWARD_BODY_TIME <= t:
                 self.body_phase = 4
                 self.body_phase_switch_ts = t
         elif self.body_phase == 4:
-            if self.body_phase_switch_ts + self.cfg.BACKWARD_BODY_TIME <= t:
+            if self.body_phase_switch_ts + cfg.BACKWARD_BODY_TIME <= t:
                 self.body_phase = 0
                 self.body_phase_switch_ts = t
 
     def _update_logic(self, bass: float, vocal_score: float, vocal_ratio: float, bass_ratio: float) -> None:
         t = self._now_ms()
+        cfg = self.cfg
 
         self._talk_loop(t)
         self._move_loop(t)
 
         bass_thr, bass_max, vocal_thr, vocal_max = self._current_thresholds()
-        mouth_ok = (vocal_ratio >= self.cfg.vocal_ratio_gate)
-        body_ok = (bass_ratio >= self.cfg.bass_ratio_gate) 
+        mouth_ok = (vocal_ratio >= cfg.vocal_ratio_gate)
+        body_ok = (bass_ratio >= cfg.bass_ratio_gate) 
         
         if mouth_ok and vocal_score >= vocal_thr and self.talking_phase == 0:
             self.talking_phase = 1
             self.talking_phase_switch_ts = t
-            self.max_time_mouth_ts = t + self.cfg.MAX_MOUTH_TIME
+            self.max_time_mouth_ts = t + cfg.MAX_MOUTH_TIME
 
         elif mouth_ok and vocal_score >= vocal_max and t <= self.max_time_mouth_ts:
-            self.talking_phase_switch_ts = t + self.cfg.OPEN_MOUTH_TIME - 10
+            self.talking_phase_switch_ts = t + cfg.OPEN_MOUTH_TIME - 10
 
         if body_ok and bass >= bass_thr and self.body_phase == 0:
-            tail = (np.random.randint(1, 10) > 6)
+            # Tail 1 in 3 times (same odds as the old randint(1, 10) > 6)
+            tail = random.random() < (1.0 / 3.0)
             self.body_phase = 3 if tail else 1
             self.body_phase_switch_ts = t
-            self.max_time_body_ts = t + self.cfg.MAX_BODY_TIME
+            self.max_time_body_ts = t + cfg.MAX_BODY_TIME
 
         elif body_ok and bass >= bass_max and t <= self.max_time_body_ts:
-            self.body_phase_switch_ts = t + self.cfg.FORWARD_BODY_TIME - 10
+            self.body_phase_switch_ts = t + cfg.FORWARD_BODY_TIME - 10
 
-        if self.cfg.debug:
+        if cfg.debug:
             now = time.monotonic()
-            if now - self._last_debug >= self.cfg.debug_every_s:
+            if now - self._last_debug >= cfg.debug_every_s:
                 self._last_debug = now
                 log_string=f"[viz] bass=%.6f vocal_score=%.6f vocal_ratio=%.4f bass_ratio=%.4f | thr(bass=%.6f vocal=%.6f) | noise(bass=%.6f vocal=%.6f) talk=%d body=%d", 
                 bass, vocal_score, vocal_ratio, bass_ratio, bass_thr, vocal_thr, 
@@ -398,19 +572,28 @@ class BillyBassVisualizer:
 
     def _process_block(self, stereo_block: np.ndarray) -> None:
         """
-        stereo_block: float32, shape (frames, 2), range [-1..1]
+        stereo_block: int16, shape (frames, channels), raw S16_LE samples
         """
-        mono = 0.5 * (stereo_block[:, 0] + stereo_block[:, 1])
+        # Unscaled channel sum straight into the mono buffer (no temporaries);
+        # the 1/(32768*channels) factor lives in self._window
+        mono = np.sum(stereo_block, axis=1, dtype=np.float32, out=self._mono)
+        if self.cfg.decimation > 1:
+            mono = self._decimate(mono)
 
-        with self._lock:
-            self._ring_push(mono)
-            samples = self._ring_snapshot_oldest_to_newest()
-            mag = self._fft_mag(samples)
-            bass, vocal_score, vocal_ratio, bass_ratio = self._compute_bass_vocal(mag)
-            self._update_logic(bass, vocal_score, vocal_ratio, bass_ratio)
+        self._ring_push(mono)
+        spec = self._fft_spectrum()
+        bass, vocal_score, vocal_ratio, bass_ratio = self._compute_bass_vocal(spec)
+        self._update_logic(bass, vocal_score, vocal_ratio, bass_ratio)
 
     def _thread_main(self) -> None:
         assert self._reader is not None
+        if self.cfg.thread_nice is not None and sys.platform.startswith("linux"):
+            # Linux niceness is per thread, so this only affects the capture thread.
+            # Elsewhere setpriority() is missing or would target a whole process.
+            try:
+                os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), self.cfg.thread_nice)
+            except OSError as e:
+                logger.debug(f"[viz] could not set thread niceness: {e}")
         last_hb = 0.0
         while self._running:
             block = self._reader.read_block()
@@ -428,7 +611,8 @@ class BillyBassVisualizer:
             now = time.monotonic()
             if now - last_hb > 2.0:
                 last_hb = now
-                rms = float(np.sqrt(np.mean(block * block)))
+                x = block.astype(np.float32) / 32768.0
+                rms = float(np.sqrt(np.mean(x * x)))
                 logger.debug(f"[viz] alive. rms={rms:.5f}")
 
             self._process_block(block)
@@ -438,6 +622,13 @@ class BillyBassVisualizer:
             return
         self._running = True
 
+        # Compile the numba kernel before arecord starts, so the JIT (up to
+        # seconds on a Pi) doesn't leave the capture pipe backing up
+        _band_update(
+            self._silent_spec, 0, 1, 0, 1,
+            0.0, 0.0, 1e-6, 1e-6, 1.0, 1.0, 0.5, 0.5, True, 0.5, 0.0,
+        )
+
         # Use arecord -> S16_LE so we avoid PortAudio S24_LE issues
         self._reader = LoopbackArecordReader(
             frames=self.cfg.blocksize,
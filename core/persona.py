@@ -1,5 +1,6 @@
 # core/persona.py
 import configparser
+import functools
 import os
 import shutil
 
@@ -27,17 +28,15 @@ class PersonaProfile:
 
     # 5 buckets for every trait
     #   min: 0–14, low: 15–34, med: 35–64, high: 65–84, max: 85–100
+    _BUCKET_LUT = tuple(
+        "min" if v < 15 else "low" if v < 35 else "med" if v < 65 else "high" if v < 85 else "max"
+        for v in range(101)
+    )
+
     @staticmethod
     def _bucket(v: int) -> str:
-        if v < 15:
-            return "min"
-        if v < 35:
-            return "low"
-        if v < 65:
-            return "med"
-        if v < 85:
-            return "high"
-        return "max"
+        # Out-of-range values clamp to the end buckets, as the old if-chain did
+        return PersonaProfile._BUCKET_LUT[max(0, min(100, int(v)))]
 
     # HARD behavior rules per trait & level (no soft descriptions elsewhere)
     TRAIT_RULES = {
@@ -99,33 +98,48 @@ class PersonaProfile:
         },
     }
 
+    # Order in which trait rules are emitted in the prompt
+    PROMPT_ORDER = (
+        "honesty",
+        "humor",
+        "sarcasm",
+        "confidence",
+        "warmth",
+        "curiosity",
+        "verbosity",
+        "formality",
+    )
+
+    PROMPT_HEADER = (
+        "YOUR BEHAVIOR IS GOVERNED BY PERSONALITY TRAITS WITH FIVE LEVELS: MIN, LOW, MED, HIGH, MAX.",
+        "MIN = TRAIT IS MUTED. MAX = TRAIT IS EXAGGERATED.",
+        "THESE TRAITS GUIDE YOUR BEHAVIORAL EXPRESSION. FOLLOW THESE RULES STRICTLY:",
+    )
+
+    # Fully formatted prompt line for every trait & level, built once
+    PROMPT_LINES = {
+        trait: {
+            bucket: f"- {trait.upper()} ({bucket.upper()}): {rule.upper()}"
+            for bucket, rule in rules.items()
+        }
+        for trait, rules in TRAIT_RULES.items()
+    }
+
     def generate_prompt(self) -> str:
         """
         Emit behavior rules derived from current trait values.
         These override other stylistic instructions.
         """
-        order = [
-            "honesty",
-            "humor",
-            "sarcasm",
-            "confidence",
-            "warmth",
-            "curiosity",
-            "verbosity",
-            "formality",
-        ]
-        lines = [
-            "YOUR BEHAVIOR IS GOVERNED BY PERSONALITY TRAITS WITH FIVE LEVELS: MIN, LOW, MED, HIGH, MAX.",
-            "MIN = TRAIT IS MUTED. MAX = TRAIT IS EXAGGERATED.",
-            "THESE TRAITS GUIDE YOUR BEHAVIORAL EXPRESSION. FOLLOW THESE RULES STRICTLY:",
-        ]
-        for trait in order:
-            val = getattr(self, trait)
-            bucket = self._bucket(val)
-            rule = self.TRAIT_RULES[trait][bucket].upper()
-            lines.append(f"- {trait.upper()} ({bucket.upper()}): {rule}")
-
-        return "\n".join(lines)
+        return _build_prompt(tuple(getattr(self, trait) for trait in self.PROMPT_ORDER))
+
+
+@functools.lru_cache(maxsize=32)
+def _build_prompt(values: tuple) -> str:
+    """Prompt text for trait values given in PersonaProfile.PROMPT_ORDER (cached)."""
+    lines = list(PersonaProfile.PROMPT_HEADER)
+    for trait, val in zip(PersonaProfile.PROMPT_ORDER, values):
+        lines.append(PersonaProfile.PROMPT_LINES[trait][PersonaProfile._bucket(val)])
+    return "\n".join(lines)
 
 
 # Define the valid trait set for migration
@@ -152,27 +166,27 @@ DEFAULT_TRAIT_VALUES = {
     'honesty': 100,
 }
 
+# Canonical trait order for migrated trait dicts
+TRAIT_ORDER = tuple(DEFAULT_TRAIT_VALUES)
+
 
 def migrate_traits(traits_dict: dict) -> dict:
     """
     Migrate old trait sets to the new reduced trait system.
     Filters out invalid traits and adds missing ones with defaults.
     """
+    # Single pass over the valid traits; anything else in traits_dict is dropped
     migrated = {}
-
-    # Add valid traits from the old set
-    for trait, value in traits_dict.items():
-        if trait in VALID_TRAITS:
-            try:
-                migrated[trait] = int(value)
-            except (ValueError, TypeError):
-                # Use default if conversion fails
-                migrated[trait] = DEFAULT_TRAIT_VALUES[trait]
-
-    # Add any missing valid traits with defaults
-    for trait, default_value in DEFAULT_TRAIT_VALUES.items():
-        if trait not in migrated:
-            migrated[trait] = default_value
+    for trait in TRAIT_ORDER:
+        value = traits_dict.get(trait)
+        if value is None:
+            migrated[trait] = DEFAULT_TRAIT_VALUES[trait]
+            continue
+        try:
+            migrated[trait] = int(value)
+        except (ValueError, TypeError):
+            # Use default if conversion fails
+            migrated[trait] = DEFAULT_TRAIT_VALUES[trait]
 
     return migrated
 
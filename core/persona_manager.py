@@ -4,93 +4,194 @@ Handles loading and switching between different personality configurations.
 """
 
 import configparser
+import functools
+import os
+import sys
 from pathlib import Path
 from typing import Any, Optional
 
 from .logger import logger
 
 
+# META values longer than this (instructions, descriptions) are not worth interning
+_INTERN_MAX_LEN = 64
+
+
+def _interned_section(config: configparser.ConfigParser, section: str) -> dict:
+    """Section items with interned keys and short values.
+
+    Keys like "voice"/"mood" and values like "ballad"/"neutral" repeat across
+    personas and are looked up on every turn.
+    """
+    if not config.has_section(section):
+        return {}
+    return {
+        sys.intern(key): sys.intern(value) if len(value) < _INTERN_MAX_LEN else value
+        for key, value in config.items(section)
+    }
+
+
+def _is_plain_persona_name(name) -> bool:
+    """True if ``name`` is a single path component (no separators, no "..")."""
+    return bool(
+        isinstance(name, str)
+        and name
+        and os.sep not in name
+        and (not os.altsep or os.altsep not in name)
+        and ".." not in name
+        and name == os.path.basename(name)
+    )
+
+
+def _reset_parser(config: configparser.ConfigParser) -> None:
+    """Empty a parser for reuse (clear() alone keeps [DEFAULT] values)."""
+    config.clear()
+    config.defaults().clear()
+
+
+def _read_meta_only(
+    path, config: Optional[configparser.ConfigParser] = None
+) -> dict[str, str]:
+    """Read just the [META] section of a persona ini (for listings).
+
+    Raises FileNotFoundError if the file is missing, so callers can try the
+    read instead of checking for the file first. Pass ``config`` to reuse one
+    parser across a directory scan.
+    """
+    if config is None:
+        config = configparser.ConfigParser()
+    else:
+        _reset_parser(config)
+    # Slurp the (small) file in one read and close it before parsing
+    with open(path) as f:
+        text = f.read()
+    config.read_string(text, source=str(path))
+    return dict(config.items("META")) if config.has_section("META") else {}
+
+
 class PersonaManager:
     """Manages different Billy personas and personality configurations."""
 
     def __init__(self):
+        # Created on first write (create_persona_from_preset); readers tolerate absence
         self.personas_dir = Path("personas")
-        self.personas_dir.mkdir(exist_ok=True)
         self.persona_presets_dir = Path("persona_presets")
+        # Plain-string forms for the per-call paths (os.path.join is much cheaper
+        # than building Path objects)
+        self._personas_dir_str = str(self.personas_dir)
+        self._presets_dir_str = str(self.persona_presets_dir)
         self.current_persona = "default"  # Default persona
-        self._persona_cache: dict[str, dict[str, Any]] = {}
+        # persona_name -> ((file mtime_ns, size), persona data)
+        self._persona_cache: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+        # Listing from get_available_personas, valid while _available_stamp matches
+        self._available_cache: Optional[list[dict]] = None
+        self._available_stamp: Optional[tuple] = None
+
+    def _scan_persona_files(self) -> tuple[tuple, list[tuple[str, str]]]:
+        """Find the custom persona files (both old format and new folder format).
+
+        Returns ``(stamp, [(persona_name, persona_file), ...])``. The stamp holds
+        whether persona.ini exists plus every listed file's name, mtime_ns and
+        size, so it changes when a persona is added, removed, renamed or edited.
+        """
+        files = []
+        file_stamps = []
+        # One scandir pass; DirEntry type checks reuse the readdir data instead of stat-ing.
+        # The directory is created on first write, so it may not exist yet.
+        try:
+            entries = os.scandir(self._personas_dir_str)
+        except FileNotFoundError:
+            entries = None
+
+        if entries is not None:
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.name.endswith(".ini") and entry.is_file():
+                            # Old format: personas/*.ini
+                            persona_name = entry.name[:-4]
+                            persona_file = entry.path
+                            st = entry.stat()
+                        elif entry.is_dir():
+                            # New format: personas/*/persona.ini
+                            persona_name = entry.name
+                            persona_file = os.path.join(entry.path, "persona.ini")
+                            st = os.stat(persona_file)
+                        else:
+                            continue
+                    except OSError:
+                        # No readable persona.ini (e.g. an empty folder)
+                        continue
+                    files.append((persona_name, persona_file))
+                    file_stamps.append((persona_name, st.st_mtime_ns, st.st_size))
+
+        stamp = (os.path.exists("persona.ini"), tuple(file_stamps))
+        return stamp, files
 
     def get_available_personas(self) -> list[dict]:
         """Get list of available persona files with their metadata."""
+        stamp, files = self._scan_persona_files()
+        if self._available_cache is not None and stamp == self._available_stamp:
+            return list(self._available_cache)
+
         personas = []
+        config = configparser.ConfigParser()
 
-        # Add default persona.ini if it exists
-        default_persona_file = Path("persona.ini")
-        if default_persona_file.exists():
+        # Add default persona.ini if it exists (its entry is fixed, no need to parse it)
+        if stamp[0]:
+            personas.append({"name": "default", "description": "Default"})
+
+        # Add custom personas from personas directory
+        for persona_name, persona_file in files:
+            # Only META is needed here; the full load (traits migration etc.)
+            # happens when a persona is actually used.
             try:
-                config = configparser.ConfigParser()
-                config.read(default_persona_file)
-                personas.append({
-                    "name": "default",
-                    "description": "Default",
-                })
+                meta = _read_meta_only(persona_file, config)
             except Exception as e:
-                logger.warning(f"Failed to load default persona: {e}")
-
-        # Add custom personas from personas directory (both old format and new folder format)
-        if self.personas_dir.exists():
-            # Check for old format: personas/*.ini
-            for file_path in self.personas_dir.glob("*.ini"):
-                persona_name = file_path.stem
-                persona_data = self.load_persona(persona_name)
-                if persona_data:
-                    personas.append({
-                        "name": persona_name,
-                        "description": persona_data.get("meta", {}).get(
-                            "description", persona_name
-                        ),
-                    })
-
-            # Check for new format: personas/*/persona.ini
-            for folder_path in self.personas_dir.iterdir():
-                if folder_path.is_dir():
-                    persona_file = folder_path / "persona.ini"
-                    if persona_file.exists():
-                        persona_name = folder_path.name
-                        persona_data = self.load_persona(persona_name)
-                        if persona_data:
-                            personas.append({
-                                "name": persona_name,
-                                "description": persona_data.get("meta", {}).get(
-                                    "description", persona_name
-                                ),
-                            })
-
-        return (
+                logger.warning(f"Failed to load persona {persona_name}: {e}")
+                continue
+            personas.append({
+                "name": persona_name,
+                "description": meta.get("description", persona_name),
+            })
+
+        personas = (
             sorted(personas, key=lambda x: x["name"])
             if personas
             else [{"name": "default", "description": "Default"}]
         )
+        self._available_cache = personas
+        self._available_stamp = stamp
+        return list(personas)
 
     def load_persona(self, persona_name: str) -> Optional[dict[str, Any]]:
         """Load a persona configuration from file."""
-        if persona_name in self._persona_cache:
-            return self._persona_cache[persona_name]
-
         # Handle default persona
         if persona_name == "default":
-            persona_file = Path("persona.ini")
+            persona_file = "persona.ini"
         else:
             # Check new folder structure first: personas/persona_name/persona.ini
-            persona_file = self.personas_dir / persona_name / "persona.ini"
-            if not persona_file.exists():
+            persona_file = os.path.join(
+                self._personas_dir_str, persona_name, "persona.ini"
+            )
+            if not os.path.exists(persona_file):
                 # Fall back to old structure: personas/persona_name.ini
-                persona_file = self.personas_dir / f"{persona_name}.ini"
+                persona_file = os.path.join(
+                    self._personas_dir_str, f"{persona_name}.ini"
+                )
 
-        if not persona_file.exists():
+        try:
+            st = os.stat(persona_file)
+        except FileNotFoundError:
             logger.warning(f"Persona file not found: {persona_file}")
             return None
 
+        # Reuse the parsed persona until the file changes on disk
+        file_key = (st.st_mtime_ns, st.st_size)
+        cached = self._persona_cache.get(persona_name)
+        if cached is not None and cached[0] == file_key:
+            return cached[1]
+
         try:
             config = configparser.ConfigParser()
             config.read(persona_file)
@@ -103,17 +204,25 @@ class PersonaManager:
                 "backstory": dict(config.items("BACKSTORY"))
                 if config.has_section("BACKSTORY")
                 else {},
-                "meta": dict(config.items("META"))
-                if config.has_section("META")
-                else {},
+                "meta": _interned_section(config, "META"),
             }
 
-            # Migrate and convert personality values to integers
+            # Migrate and convert personality values to integers (the migrated keys
+            # are the TRAIT_ORDER literals, so they are interned already)
             from .persona import migrate_traits
 
             persona_data["personality"] = migrate_traits(persona_data["personality"])
 
-            self._persona_cache[persona_name] = persona_data
+            # Preformatted pieces of the compact instructions format
+            persona_data["_traits_str"] = ", ".join(
+                f"{trait}:{value}"
+                for trait, value in persona_data["personality"].items()
+            )
+            persona_data["_backstory_str"] = "; ".join(
+                f"{key}: {value}" for key, value in persona_data["backstory"].items()
+            )
+
+            self._persona_cache[persona_name] = (file_key, persona_data)
             logger.info(f"Loaded persona: {persona_name}", "🎭")
             return persona_data
 
@@ -127,37 +236,48 @@ class PersonaManager:
         if not persona_data:
             return ""
 
+        # Formatted once per loaded persona; a reload (file change) yields a fresh dict
+        cached = persona_data.get("_instructions")
+        if cached is not None:
+            return cached
+
         # Get persona-specific instructions from META section
         persona_specific_instructions = persona_data['meta'].get('instructions', '')
 
         # If this persona has specific instructions, use them instead of the default format
         if persona_specific_instructions and persona_name != 'default':
-            return persona_specific_instructions
-
-        # For default persona or personas without specific instructions, use compact format
-        instructions = f"[PERSONA: {persona_data['meta'].get('description', persona_name)} | MOOD: {persona_data['meta'].get('mood', 'neutral')} | ENERGY: {persona_data['meta'].get('energy', 'medium')}]\n"
-
-        # Format backstory as key-value pairs
-        if persona_data['backstory']:
-            backstory_parts = []
-            for key, value in persona_data['backstory'].items():
-                backstory_parts.append(f"{key}: {value}")
-            instructions += f"Backstory: {'; '.join(backstory_parts)}\n"
+            instructions = persona_specific_instructions
+        else:
+            # For default persona or personas without specific instructions, use compact format
+            instructions = f"[PERSONA: {persona_data['meta'].get('description', persona_name)} | MOOD: {persona_data['meta'].get('mood', 'neutral')} | ENERGY: {persona_data['meta'].get('energy', 'medium')}]\n"
 
-        # Compact personality traits
-        if persona_data["personality"]:
-            traits = [
-                f"{trait}:{value}"
-                for trait, value in persona_data["personality"].items()
-            ]
-            instructions += f"Traits: {', '.join(traits)}\n"
+            # Backstory key-value pairs and compact traits, formatted at load time
+            if persona_data['_backstory_str']:
+                instructions += f"Backstory: {persona_data['_backstory_str']}\n"
+            if persona_data['_traits_str']:
+                instructions += f"Traits: {persona_data['_traits_str']}\n"
 
+        persona_data["_instructions"] = instructions
         return instructions
 
     def switch_persona(self, persona_name: str) -> bool:
         """Switch to a different persona."""
-        available_personas = [p["name"] for p in self.get_available_personas()]
-        if persona_name not in available_personas:
+        # Names come from tool calls / requests: a bare name only, so the file
+        # checks below can't be pointed outside personas/
+        if not _is_plain_persona_name(persona_name):
+            logger.warning(f"Invalid persona name: {persona_name!r}")
+            return False
+
+        # Check the persona's own file(s) rather than building the full listing
+        if persona_name == "default":
+            available = os.path.isfile("persona.ini")
+        else:
+            available = os.path.isfile(
+                os.path.join(self._personas_dir_str, persona_name, "persona.ini")
+            ) or os.path.isfile(
+                os.path.join(self._personas_dir_str, f"{persona_name}.ini")
+            )
+        if not available:
             logger.warning(f"Persona not available: {persona_name}")
             return False
 
@@ -187,6 +307,8 @@ class PersonaManager:
 
     def clear_persona_cache(self, persona_name: str = None) -> None:
         """Clear the cache for a specific persona or all personas."""
+        # Descriptions in the listing come from the persona files, so drop it too
+        self._available_cache = None
         if persona_name:
             self._persona_cache.pop(persona_name, None)
             logger.info(f"Cleared cache for persona: {persona_name}", "🎭")
@@ -197,31 +319,34 @@ class PersonaManager:
     def get_persona_presets(self) -> list[dict]:
         """Get list of available persona preset templates."""
         presets = []
-
-        if not self.persona_presets_dir.exists():
-            return presets
+        config = configparser.ConfigParser()
 
         # Check for presets in persona_presets/*/persona.ini
-        for folder_path in self.persona_presets_dir.iterdir():
-            if folder_path.is_dir():
-                preset_file = folder_path / "persona.ini"
-                if preset_file.exists():
-                    preset_name = folder_path.name
-                    try:
-                        config = configparser.ConfigParser()
-                        config.read(preset_file)
-
-                        # Get name and description from META section
-                        name = config.get("META", "name", fallback=preset_name.title())
-                        description = config.get("META", "description", fallback="")
+        try:
+            entries = os.scandir(self._presets_dir_str)
+        except FileNotFoundError:
+            return presets
 
-                        presets.append({
-                            "id": preset_name,
-                            "name": name,
-                            "description": description,
-                        })
-                    except Exception as e:
-                        logger.warning(f"Failed to load preset {preset_name}: {e}")
+        with entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                preset_name = entry.name
+                try:
+                    # Get name and description from META section
+                    meta = _read_meta_only(
+                        os.path.join(entry.path, "persona.ini"), config
+                    )
+                except FileNotFoundError:
+                    continue
+                except Exception as e:
+                    logger.warning(f"Failed to load preset {preset_name}: {e}")
+                    continue
+                presets.append({
+                    "id": preset_name,
+                    "name": meta.get("name", preset_name.title()),
+                    "description": meta.get("description", ""),
+                })
 
         return sorted(presets, key=lambda x: x["name"])
 
@@ -239,25 +364,30 @@ class PersonaManager:
             # Create the new persona directory
             new_persona_dir = self.personas_dir / new_persona_name
             new_persona_dir.mkdir(parents=True, exist_ok=True)
+            new_persona_file = new_persona_dir / "persona.ini"
 
-            # Copy the preset file to the new persona
-            import shutil
-
-            shutil.copy(preset_file, new_persona_dir / "persona.ini")
-
-            # Update the name in the persona file if display_name is provided
+            # With a display_name, parse the preset once and write the renamed copy
+            # directly; otherwise (or if there's no META to rename) copy it as-is
+            config = None
             if display_name:
-                new_persona_file = new_persona_dir / "persona.ini"
                 config = configparser.ConfigParser()
-                config.read(new_persona_file)
-
-                if config.has_section('META'):
-                    config.set('META', 'name', display_name)
-
-                    with open(new_persona_file, 'w') as f:
-                        config.write(f)
-
-            # Clear cache for the new persona
+                config.read(preset_file)
+                if not config.has_section('META'):
+                    config = None
+
+            if config is not None:
+                # Persona files are read with interpolation, so a literal % is stored as %%
+                config.set('META', 'name', display_name.replace('%', '%%'))
+                with open(new_persona_file, 'w') as f:
+                    config.write(f)
+            else:
+                import shutil
+
+                shutil.copyfile(preset_file, new_persona_file)
+
+            # Drop any cached copy of a persona with this name (recreating it
+            # rewrites a file inside an existing folder, which the listing's
+            # directory stamp doesn't see)
             self.clear_persona_cache(new_persona_name)
 
             logger.info(
@@ -270,5 +400,15 @@ class PersonaManager:
             return False
 
 
-# Global persona manager instance
-persona_manager = PersonaManager()
+@functools.cache
+def get_persona_manager() -> PersonaManager:
+    """Return the shared PersonaManager, constructing it on first use."""
+    return PersonaManager()
+
+
+def __getattr__(name: str):
+    # Global persona manager instance, built lazily so importing this module
+    # does no work; ``from core.persona_manager import persona_manager`` still works
+    if name == "persona_manager":
+        return get_persona_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,22 +3,112 @@ User Profile Management System for Billy Bass Assistant.
 Handles user identification, memory storage, and profile management.
 """
 
+import bisect
 import configparser
+import functools
 import json
 import os
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
+from uuid import uuid4
 
+from . import jsonutil
 from .logger import logger
 
 
+# Complete memory objects inside a corrupted CORE_MEMORIES JSON string
+_MEMORY_OBJ_RE = re.compile(r'\{[^{}]*"id"[^{}]*\}')
+
+PROFILES_DIR = Path("profiles")
+
+
+@functools.cache
+def _ensure_profiles_dir() -> None:
+    """Create the profiles directory (the mkdir runs once per process)."""
+    PROFILES_DIR.mkdir(exist_ok=True)
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_profile_ini(
+    path: str, file_key: tuple[int, int, int]
+) -> tuple[tuple[str, tuple[tuple[str, str], ...]], ...]:
+    """Parse a profile INI into (section, items) pairs.
+
+    Cached per file version: ``file_key`` is the file's (st_ino, mtime_ns, size).
+    Saves replace the file (os.replace), so each one gets a new inode and thus a
+    new key even when mtime and size come out the same. Returns immutable data; callers build fresh dicts.
+    """
+    config = configparser.ConfigParser()
+    config.read(path)
+    return tuple(
+        (section, tuple(config[section].items())) for section in config.sections()
+    )
+
+
+# Profiles are read back with an interpolating ConfigParser; values written
+# directly must pass the same check ConfigParser.set() applies
+_INTERPOLATION = configparser.BasicInterpolation()
+
+
+# Core memories kept per profile, and their ordering (least important first)
+MAX_CORE_MEMORIES = 20
+_IMPORTANCE_ORDER = {"high": 3, "medium": 2, "low": 1}
+
+
+def _importance_rank(memory: dict[str, Any]) -> int:
+    return _IMPORTANCE_ORDER.get(memory.get("importance", "low"), 1)
+
+
+# [USER_INFO] section body and the lines of the fields that are read on cheap
+# profile scans or rewritten in place by _save_user_info_fields
+_USER_INFO_RE = re.compile(r'^\[USER_INFO\][ \t]*\n(.*?)(?=^\[|\Z)', re.M | re.S)
+_USER_INFO_FIELD_RES = {
+    key: re.compile(rf'^{key}[ \t]*[=:][ \t]*(.*?)[ \t]*$', re.M)
+    for key in ("display_name", "preferred_persona", "last_seen", "interaction_count")
+}
+# Indented line (after optional blank lines) continuing the value on the line
+# before it
+_CONTINUATION_RE = re.compile(r'\n(?:[ \t]*\n)*[ \t]+\S')
+
+
+# Profiles are saved with [USER_INFO] first and the (large) memories JSON after it,
+# so a scan usually only needs the head of the file
+_USER_INFO_HEAD_CHARS = 4096
+
+
+def _read_user_info_field(path, key: str, default: str = "") -> str:
+    """Read one USER_INFO value from a profile without a full INI parse."""
+    with open(path) as f:
+        text = f.read(_USER_INFO_HEAD_CHARS)
+        section = _USER_INFO_RE.search(text)
+        if section is None or section.end(1) == len(text):
+            # Section missing or possibly cut off at the end of the head
+            text += f.read()
+            section = _USER_INFO_RE.search(text)
+    if section:
+        match = _USER_INFO_FIELD_RES[key].search(section.group(1))
+        if match:
+            return match.group(1)
+
+    # Unusual layout (or field not set yet): let configparser decide
+    config = configparser.ConfigParser()
+    config.read_string(text, source=str(path))
+    return config.get("USER_INFO", key, fallback=default)
+
+
 class UserProfile:
     """Represents a user profile with memories and preferences."""
 
     def __init__(self, name: str):
         self.name = name
-        self.profile_path = Path("profiles") / f"{name.lower()}.ini"
+        self.profile_path = PROFILES_DIR / f"{name.lower()}.ini"
+        # Set by saves, cleared once flush_to_disk() has fsynced the profiles dir
+        self._unsynced = False
+        # get_context_string() result; every profile change goes through a save,
+        # which drops it
+        self._context_cache: Optional[str] = None
         self.data = self._load_or_create_profile()
 
     def _load_or_create_profile(self) -> dict[str, Any]:
@@ -29,34 +119,37 @@ class UserProfile:
 
     def _load_profile(self) -> dict[str, Any]:
         """Load profile from INI file."""
-        config = configparser.ConfigParser()
-        config.read(self.profile_path)
+        st = os.stat(self.profile_path)
+        sections = _parse_profile_ini(
+            str(self.profile_path), (st.st_ino, st.st_mtime_ns, st.st_size)
+        )
 
-        # Convert INI to dict
-        data = {}
-        for section in config.sections():
-            data[section] = dict(config[section])
+        # Convert INI to dict (fresh dicts, the parsed result is shared)
+        data = {section: dict(items) for section, items in sections}
 
         # Parse core memories from JSON
+        recovered = False
         if 'CORE_MEMORIES' in data:
+            memories_str = data['CORE_MEMORIES'].get('memories', '[]')
             try:
-                memories_str = data['CORE_MEMORIES'].get('memories', '[]')
-                data['core_memories'] = json.loads(memories_str)
+                # Cheap shape check: anything that isn't a JSON list goes straight
+                # to recovery instead of through a parse that can only fail
+                stripped = memories_str.strip()
+                if stripped[:1] != '[' or stripped[-1:] != ']':
+                    raise json.JSONDecodeError("Not a JSON list", memories_str, 0)
+                data['core_memories'] = jsonutil.loads(memories_str)
             except json.JSONDecodeError as e:
                 logger.warning(f"Failed to parse memories JSON for {self.name}: {e}")
                 logger.warning(f"Corrupted memories string: {memories_str[:200]}...")
 
                 # Try to recover by extracting valid JSON entries
                 try:
-                    # Look for complete JSON objects in the corrupted string
-                    import re
-
                     # Find all complete JSON objects that start with { and end with }
-                    json_objects = re.findall(r'\{[^{}]*"id"[^{}]*\}', memories_str)
+                    json_objects = _MEMORY_OBJ_RE.findall(memories_str)
                     recovered_memories = []
                     for obj_str in json_objects:
                         try:
-                            recovered_memories.append(json.loads(obj_str))
+                            recovered_memories.append(jsonutil.loads(obj_str))
                         except json.JSONDecodeError:
                             continue
 
@@ -65,8 +158,9 @@ class UserProfile:
                         logger.info(
                             f"Recovered {len(recovered_memories)} memories for {self.name}"
                         )
-                        # Save the recovered memories back to the file
-                        self._save_profile()
+                        # Save the recovered memories back to the file (below, once
+                        # the rest of the profile has been loaded)
+                        recovered = True
                     else:
                         data['core_memories'] = []
                         logger.warning(
@@ -102,6 +196,9 @@ class UserProfile:
                 data['USER_INFO'] = {}
             data['USER_INFO']['display_name'] = self.name
 
+        if recovered:
+            self._save_profile(data)
+
         return data
 
     def _create_new_profile(self) -> dict[str, Any]:
@@ -110,14 +207,15 @@ class UserProfile:
         from .persona_manager import persona_manager
 
         current_persona = persona_manager.current_persona
+        now = datetime.now().isoformat()
 
         data = {
             'USER_INFO': {
                 'name': self.name,
                 'display_name': self.name,
                 'preferred_persona': current_persona,
-                'created_date': datetime.now().isoformat(),
-                'last_seen': datetime.now().isoformat(),
+                'created_date': now,
+                'last_seen': now,
                 'interaction_count': '0',
                 'bond_level': 'new',
             },
@@ -163,46 +261,122 @@ class UserProfile:
         """Save profile to INI file."""
         if data is None:
             data = self.data
+        self._context_cache = None
 
-        config = configparser.ConfigParser()
-
-        # Convert dict to INI sections
+        # Convert dict to INI sections. Written directly in the layout
+        # ConfigParser.write() produces (lowercased keys, 'key = value', indented
+        # continuation lines, blank line after each section) for the same output
+        # without building a parser.
+        sections = {}
         for section_name, section_data in data.items():
             if section_name == 'core_memories':
                 continue  # Handle separately
 
-            if not config.has_section(section_name):
-                config.add_section(section_name)
+            options = sections.setdefault(section_name, {})
             for key, value in section_data.items():
                 # Handle JSON fields properly
                 if key == 'aliases' and isinstance(value, list):
-                    config.set(section_name, key, json.dumps(value))
+                    options[key.lower()] = json.dumps(value)
                 else:
-                    config.set(section_name, key, str(value))
+                    options[key.lower()] = str(value)
 
-        # Save core memories as JSON
-        if not config.has_section('CORE_MEMORIES'):
-            config.add_section('CORE_MEMORIES')
-        config.set(
-            'CORE_MEMORIES', 'memories', json.dumps(data.get('core_memories', []))
+        # Save core memories as JSON. Stdlib json.dumps on purpose: its ASCII-only
+        # output (\uXXXX escapes) is safe under any locale encoding the profile
+        # is opened with, and keeps the file format unchanged
+        sections.setdefault('CORE_MEMORIES', {})['memories'] = json.dumps(
+            data.get('core_memories', [])
         )
 
+        parts = []
+        for section_name, options in sections.items():
+            parts.append(f"[{section_name}]\n")
+            for key, value in options.items():
+                _INTERPOLATION.before_set(None, section_name, key, value)
+                value = value.replace('\n', '\n\t')
+                parts.append(f"{key} = {value}\n")
+            parts.append("\n")
+
         # Ensure directory exists
-        self.profile_path.parent.mkdir(exist_ok=True)
+        _ensure_profiles_dir()
+
+        self._replace_profile_file("".join(parts))
+
+    def _replace_profile_file(self, text: str):
+        """Write the profile to a sibling .tmp file, fsync it and swap it in with
+        os.replace, so a crash never leaves a truncated profile behind."""
+        tmp_path = self.profile_path.with_name(self.profile_path.name + ".tmp")
+        with open(tmp_path, 'w') as f:
+            f.write(text)
+            # The data must be on disk before the rename, or a power cut after it
+            # can leave an empty file in place of the old profile
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.profile_path)
+        # Only the directory entry is left to sync; flush_to_disk() does that once
+        # per session instead of on every save
+        self._unsynced = True
+
+    def _save_user_info_fields(self, **fields: str):
+        """Rewrite only the given USER_INFO lines of the saved profile.
+
+        Scalar updates don't need the core memories JSON re-serialized. Falls
+        back to a full _save_profile() whenever the lines can't be patched.
+        """
+        self._context_cache = None
+        try:
+            with open(self.profile_path) as f:
+                text = f.read()
+        except FileNotFoundError:
+            self._save_profile()
+            return
 
-        with open(self.profile_path, 'w') as f:
-            config.write(f)
-            f.flush()  # Flush Python buffer
-            os.fsync(f.fileno())  # Force write to disk
+        section = _USER_INFO_RE.search(text)
+        if section is None:
+            self._save_profile()
+            return
+
+        body = section.group(1)
+        for key, value in fields.items():
+            value = str(value)
+            # Multi-line values (new or already saved) need configparser's
+            # continuation format, and '%' must go through its interpolation check
+            match = _USER_INFO_FIELD_RES[key].search(body)
+            if (
+                match is None
+                or "\n" in value
+                or "%" in value
+                or _CONTINUATION_RE.match(body, match.end())
+            ):
+                self._save_profile()
+                return
+            body = f"{body[: match.start()]}{key} = {value}{body[match.end() :]}"
+
+        self._replace_profile_file(
+            text[: section.start(1)] + body + text[section.end(1) :]
+        )
+
+    def flush_to_disk(self):
+        """Force saved profile changes to disk (called at end of session)."""
+        if not self._unsynced:
+            return
+        try:
+            # The file data was synced before os.replace; this persists the
+            # directory entry the rename swapped in
+            fd = os.open(self.profile_path.parent, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            self._unsynced = False
+        except OSError as e:
+            logger.warning(f"Failed to sync profile for {self.name}: {e}")
 
     def add_memory(
         self, memory: str, importance: str = "medium", category: str = "fact"
     ):
         """Add a memory to the user's profile."""
-        import uuid
-
         memory_entry = {
-            "id": str(uuid.uuid4()),
+            "id": str(uuid4()),
             "date": datetime.now().isoformat(),
             "memory": memory,
             "importance": importance,
@@ -213,14 +387,18 @@ class UserProfile:
         if not isinstance(self.data.get('core_memories'), list):
             self.data['core_memories'] = []
 
-        self.data['core_memories'].append(memory_entry)
-
-        # Keep only most important memories (limit to 20)
-        importance_order = {"high": 3, "medium": 2, "low": 1}
-        self.data['core_memories'] = sorted(
-            self.data['core_memories'],
-            key=lambda x: importance_order.get(x.get("importance", "low"), 1),
-        )[-20:]
+        # Keep only most important memories (limit to 20). The list is kept ordered
+        # by importance (oldest first within a level), so the new memory is inserted
+        # after its peers and the least important, oldest one drops off the front.
+        memories = self.data['core_memories']
+        ranks = [_importance_rank(m) for m in memories]
+        if any(a > b for a, b in zip(ranks, ranks[1:])):
+            # Hand-edited / legacy file: restore the ordering once
+            memories.sort(key=_importance_rank)
+            ranks.sort()
+        rank = _importance_rank(memory_entry)
+        memories.insert(bisect.bisect_right(ranks, rank), memory_entry)
+        del memories[:-MAX_CORE_MEMORIES]
 
         # Validate memories before saving
         try:
@@ -231,19 +409,24 @@ class UserProfile:
         except (TypeError, ValueError) as e:
             logger.error(f"Failed to save memory for {self.name}: {e}")
             # Remove the problematic memory
-            self.data['core_memories'] = self.data['core_memories'][:-1]
+            if memory_entry in self.data['core_memories']:
+                self.data['core_memories'].remove(memory_entry)
 
     def update_last_seen(self):
-        """Update the last seen timestamp."""
+        """Update the last seen timestamp (in memory; written by the next save,
+        normally increment_interaction_count at the end of the session)."""
         self.data['USER_INFO']['last_seen'] = datetime.now().isoformat()
-        self._save_profile()
 
     def increment_interaction_count(self):
         """Increment the interaction count and update last_seen (called at end of session)."""
         interaction_count = int(self.data['USER_INFO'].get('interaction_count', '0'))
         self.data['USER_INFO']['interaction_count'] = str(interaction_count + 1)
         self.data['USER_INFO']['last_seen'] = datetime.now().isoformat()
-        self._save_profile()
+        self._save_user_info_fields(
+            interaction_count=self.data['USER_INFO']['interaction_count'],
+            last_seen=self.data['USER_INFO']['last_seen'],
+        )
+        self.flush_to_disk()
         logger.info(
             f"Incremented interaction count for {self.name}: {interaction_count + 1}",
             "👤",
@@ -252,13 +435,17 @@ class UserProfile:
     def set_preferred_persona(self, persona: str):
         """Set the user's preferred Billy persona."""
         self.data['USER_INFO']['preferred_persona'] = persona
-        self._save_profile()
+        self._save_user_info_fields(preferred_persona=persona)
+        # Rare, user-initiated change (also from the web UI, outside any session
+        # that would flush at its end): make it durable right away
+        self.flush_to_disk()
         logger.info(f"Set {self.name}'s preferred persona to {persona}", "🎭")
 
     def set_display_name(self, display_name: str):
         """Set the user's display name."""
         self.data['USER_INFO']['display_name'] = display_name
-        self._save_profile()
+        self._save_user_info_fields(display_name=display_name)
+        self.flush_to_disk()
         logger.info(f"Set {self.name}'s display name to {display_name}", "👤")
 
     def get_memories(self, limit: int = 5) -> list[dict[str, Any]]:
@@ -282,16 +469,13 @@ class UserProfile:
                 logger.info(f"Raw memories string: {memories_str[:200]}...")
 
                 # Try to extract valid JSON objects using regex
-                import re
-
-                # Find all complete JSON objects
-                json_objects = re.findall(r'\{[^{}]*"id"[^{}]*\}', memories_str)
+                json_objects = _MEMORY_OBJ_RE.findall(memories_str)
                 logger.info(f"Found {len(json_objects)} potential JSON objects")
 
                 recovered_memories = []
                 for i, obj_str in enumerate(json_objects):
                     try:
-                        memory_obj = json.loads(obj_str)
+                        memory_obj = jsonutil.loads(obj_str)
                         # Validate required fields
                         if all(
                             key in memory_obj
@@ -333,12 +517,16 @@ class UserProfile:
 
     def get_context_string(self) -> str:
         """Get formatted context string for AI prompt."""
+        if self._context_cache is not None:
+            return self._context_cache
+
         context = f"\n[USER: {self.name} | PERSONA: {self.data['USER_INFO'].get('preferred_persona', 'default')} | BOND: {self.data['USER_INFO'].get('bond_level', 'new')}]\n"
 
         memories = self.get_memories(3)  # Reduced from 5 to 3
         if memories:
             context += f"Memories: {'; '.join([m['memory'] for m in memories])}\n"
 
+        self._context_cache = context
         return context
 
 
@@ -347,37 +535,54 @@ class UserProfileManager:
 
     def __init__(self):
         self.current_user: Optional[UserProfile] = None
-        self.profiles_dir = Path("profiles")
-        self.profiles_dir.mkdir(exist_ok=True)
+        self.profiles_dir = PROFILES_DIR
+        _ensure_profiles_dir()
+        # profile filename -> ((st_ino, mtime_ns, size), lowercased display_name)
+        self._display_index: dict[str, tuple[tuple[int, int, int], str]] = {}
+
+    def _profile_display_name(self, entry: os.DirEntry) -> str:
+        """Lowercased display_name of a profile, re-read only when the file changed."""
+        st = entry.stat()
+        file_key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = self._display_index.get(entry.name)
+        if cached is not None and cached[0] == file_key:
+            return cached[1]
+
+        display_name = _read_user_info_field(entry.path, "display_name").lower()
+        self._display_index[entry.name] = (file_key, display_name)
+        return display_name
 
     def find_user_by_name_or_display_name(self, name: str) -> Optional[str]:
         """Find a user profile by name or display name. Returns the actual profile name if found."""
         name = name.strip().title()
 
         # First check if there's an exact match
-        profile_path = Path("profiles") / f"{name.lower()}.ini"
+        profile_path = self.profiles_dir / f"{name.lower()}.ini"
         if profile_path.exists():
             return name
 
-        # Check all profiles for display_name
-        profiles_dir = Path("profiles")
-        if not profiles_dir.exists():
+        # Check all profiles for display_name (cached per file until it changes)
+        try:
+            entries = os.scandir(self.profiles_dir)
+        except FileNotFoundError:
             return None
 
-        for profile_file in profiles_dir.glob("*.ini"):
-            try:
-                config = configparser.ConfigParser()
-                config.read(profile_file)
-
-                if config.has_section("USER_INFO"):
+        name_lower = name.lower()
+        with entries:
+            for entry in entries:
+                # Same files as profiles_dir.glob("*.ini")
+                if not entry.name.endswith(".ini"):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
                     # Check if the name matches the display_name
-                    display_name = config.get("USER_INFO", "display_name", fallback="")
-                    if name.lower() == display_name.lower():
+                    if self._profile_display_name(entry) == name_lower:
                         # Return the actual profile name (from filename)
-                        return profile_file.stem.title()
+                        return entry.name[:-4].title()
 
-            except Exception:
-                continue
+                except Exception:
+                    continue
 
         return None
 
@@ -420,10 +625,17 @@ class UserProfileManager:
 
     def list_all_users(self) -> list[str]:
         """List all known users."""
-        users = []
-        for profile_file in self.profiles_dir.glob("*.ini"):
-            name = profile_file.stem.title()
-            users.append(name)
+        try:
+            entries = os.scandir(self.profiles_dir)
+        except FileNotFoundError:
+            return []
+        with entries:
+            # Same names as profiles_dir.glob("*.ini"), straight from the dir entries
+            users = [
+                entry.name[:-4].title()
+                for entry in entries
+                if entry.name.endswith(".ini")
+            ]
         return sorted(users)
 
     def get_user_context(self) -> str:
@@ -1,10 +1,40 @@
-import json
 from typing import Any, Optional
 from openai import OpenAI
+from .. import jsonutil
 from ..realtime_ai_provider import RealtimeAIProvider
 import asyncio
 
 class OpenAIProvider(RealtimeAIProvider):
+    __slots__ = ("api_key", "model", "voice", "http_client")
+
+    _SUPPORTED_VOICES = (
+        "alloy",
+        "ash",
+        "ballad",
+        "echo",
+        "sage",
+        "shimmer",
+        "verse",
+        "marin",
+        "cedar",
+    )
+    # Hashed lookup for voice validation (the tuple keeps the listing order)
+    _SUPPORTED_VOICE_SET = frozenset(_SUPPORTED_VOICES)
+    # Constant websocket message, serialized once
+    _RESPONSE_CREATE = jsonutil.dumps({"type": "response.create"})
+    # session.update sent by generate_audio_clip, serialized once around the
+    # per-call instructions and voice values
+    _CLIP_SESSION_UPDATE_HEAD = (
+        '{"type":"session.update","session":{"type":"realtime","instructions":'
+    )
+    _CLIP_SESSION_UPDATE_MID = (
+        ',"audio":{"input":'
+        + jsonutil.dumps({"format": {"type": "audio/pcm", "rate": 24000}})
+        + ',"output":{"format":'
+        + jsonutil.dumps({"type": "audio/pcm", "rate": 24000})
+        + ',"voice":'
+    )
+
     def __init__(
         self,
         api_key: str,
@@ -13,7 +43,7 @@ class OpenAIProvider(RealtimeAIProvider):
     ):
         self.api_key = api_key
         self.model = model
-        if voice and voice in self.get_supported_voices():
+        if voice and voice in self._SUPPORTED_VOICE_SET:
             self.voice = voice
         else:
             self.voice = self.default_voice
@@ -38,49 +68,38 @@ class OpenAIProvider(RealtimeAIProvider):
 
         ws = await self._connect_websocket()
         async with ws:
-            # Send session update
+            # Session update
             session_instructions = "IMPORTANT: Always respond by speaking the exact user text out loud. Do not add, change or rephrase anything!"
             if instructions:
                 session_instructions += "\n\n" + instructions
 
-            await ws.send(
-                json.dumps({
-                    "type": "session.update",
-                    "session": {
-                        "type": "realtime",
-                        "instructions": session_instructions,
-                        "audio": {
-                            "input": {
-                                "format": {"type": "audio/pcm", "rate": 24000},
-                            },
-                            "output": {
-                                "format": {"type": "audio/pcm", "rate": 24000},
-                                "voice": voice,
-                            },
-                        },
-                    },
-                })
+            session_update = (
+                self._CLIP_SESSION_UPDATE_HEAD
+                + jsonutil.dumps(session_instructions)
+                + self._CLIP_SESSION_UPDATE_MID
+                + jsonutil.dumps(voice)
+                + "}}}}"
             )
 
-            # Send conversation item
-            await ws.send(
-                json.dumps({
-                    "type": "conversation.item.create",
-                    "item": {
-                        "type": "message",
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "input_text",
-                                "text": "Repeat this literal message:" + prompt,
-                            }
-                        ],
-                    },
-                })
-            )
+            # Conversation item
+            item_create = jsonutil.dumps({
+                "type": "conversation.item.create",
+                "item": {
+                    "type": "message",
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "input_text",
+                            "text": "Repeat this literal message:" + prompt,
+                        }
+                    ],
+                },
+            })
 
-            # Create response
-            await ws.send(json.dumps({"type": "response.create"}))
+            # Send session update, conversation item and response.create together
+            await self._send_batch(
+                ws, (session_update, item_create, self._RESPONSE_CREATE)
+            )
 
             # Collect audio
             audio_bytes = await self._collect_audio_response(ws)
@@ -110,17 +129,7 @@ class OpenAIProvider(RealtimeAIProvider):
         return await asyncio.to_thread(run)
 
     def get_supported_voices(self) -> list[str]:
-        return [
-            "alloy",
-            "ash",
-            "ballad",
-            "echo",
-            "sage",
-            "shimmer",
-            "verse",
-            "marin",
-            "cedar",
-        ]
+        return list(self._SUPPORTED_VOICES)
 
     def get_provider_name(self) -> str:
         return "openai"
@@ -175,12 +184,12 @@ class OpenAIProvider(RealtimeAIProvider):
         """Connect to the provider's websocket, send initial config, and return the connection"""
         ws = await self._connect_websocket()
         config = self._get_initial_session_config(instructions, tools, **kwargs)
-        await ws.send(json.dumps(config))
+        await ws.send(jsonutil.dumps(config))
         return ws
 
     async def send_message(self, ws, payload: dict[str, Any]):
         """Send a JSON payload over the websocket"""
-        await ws.send(json.dumps(payload))
+        await ws.send(jsonutil.dumps(payload))
 
     def get_provider_tools(self) -> list[dict]:
         # OpenAI doesn't have provider-specific tools beyond the base ones
@@ -1,17 +1,39 @@
-import json
 from typing import Any, Optional
 
+from .. import jsonutil
 from ..realtime_ai_provider import RealtimeAIProvider
 
 
 class XAIProvider(RealtimeAIProvider):
+    __slots__ = ("api_key", "voice")
+
+    _SUPPORTED_VOICES = ("Ara", "Rex", "Sal", "Eve", "Leo")
+    # Hashed lookup for voice validation (the tuple keeps the listing order)
+    _SUPPORTED_VOICE_SET = frozenset(_SUPPORTED_VOICES)
+    # Constant websocket message, serialized once
+    _RESPONSE_CREATE = jsonutil.dumps({
+        "type": "response.create",
+        "response": ["text", "audio"],
+    })
+    # session.update sent by generate_audio_clip, serialized once around the
+    # per-call voice and instructions values
+    _CLIP_SESSION_UPDATE_HEAD = '{"type":"session.update","session":{"voice":'
+    _CLIP_SESSION_UPDATE_TAIL = (
+        ',"audio":'
+        + jsonutil.dumps({
+            "input": {"format": {"type": "audio/pcm", "rate": 24000}},
+            "output": {"format": {"type": "audio/pcm", "rate": 24000}},
+        })
+        + "}}"
+    )
+
     def __init__(
         self,
         api_key: str,
         voice: Optional[str] = None,
     ):
         self.api_key = api_key
-        if voice and voice in self.get_supported_voices():
+        if voice and voice in self._SUPPORTED_VOICE_SET:
             self.voice = voice
         else:
             self.voice = self.default_voice
@@ -24,7 +46,7 @@ class XAIProvider(RealtimeAIProvider):
         return "wss://api.x.ai/v1/realtime"
 
     def get_supported_voices(self) -> list[str]:
-        return ["Ara", "Rex", "Sal", "Eve", "Leo"]
+        return list(self._SUPPORTED_VOICES)
 
     def get_provider_name(self) -> str:
         return "xai"
@@ -44,49 +66,37 @@ class XAIProvider(RealtimeAIProvider):
 
         ws = await self._connect_websocket()
         async with ws:
-            # Send session update
+            # Session update
             session_instructions = "IMPORTANT: Always respond by speaking the exact user text out loud. Do not add, change or rephrase anything!"
             if instructions:
                 session_instructions += "\n\n" + instructions
 
-            await ws.send(
-                json.dumps({
-                    "type": "session.update",
-                    "session": {
-                        "voice": voice,
-                        "instructions": session_instructions,
-                        "audio": {
-                            "input": {
-                                "format": {"type": "audio/pcm", "rate": 24000},
-                            },
-                            "output": {
-                                "format": {"type": "audio/pcm", "rate": 24000},
-                            },
-                        },
-                    },
-                })
-            )
-
-            # Send conversation item
-            await ws.send(
-                json.dumps({
-                    "type": "conversation.item.create",
-                    "item": {
-                        "type": "message",
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "input_text",
-                                "text": "Repeat this literal message:" + prompt,
-                            }
-                        ],
-                    },
-                })
+            session_update = (
+                self._CLIP_SESSION_UPDATE_HEAD
+                + jsonutil.dumps(voice)
+                + ',"instructions":'
+                + jsonutil.dumps(session_instructions)
+                + self._CLIP_SESSION_UPDATE_TAIL
             )
 
-            # Create response
-            await ws.send(
-                json.dumps({"type": "response.create", "response": ["text", "audio"]})
+            # Conversation item
+            item_create = jsonutil.dumps({
+                "type": "conversation.item.create",
+                "item": {
+                    "type": "message",
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "input_text",
+                            "text": "Repeat this literal message:" + prompt,
+                        }
+                    ],
+                },
+            })
+
+            # Send session update, conversation item and response.create together
+            await self._send_batch(
+                ws, (session_update, item_create, self._RESPONSE_CREATE)
             )
 
             # Collect audio
@@ -111,7 +121,7 @@ class XAIProvider(RealtimeAIProvider):
         # Validate voice is supported, otherwise use default
         voice = (
             requested_voice
-            if requested_voice in self.get_supported_voices()
+            if requested_voice in self._SUPPORTED_VOICE_SET
             else self.default_voice
         )
 
@@ -145,12 +155,12 @@ class XAIProvider(RealtimeAIProvider):
         """Connect to the provider's websocket, send initial config, and return the connection"""
         ws = await self._connect_websocket()
         config = self._get_initial_session_config(instructions, tools, **kwargs)
-        await ws.send(json.dumps(config))
+        await ws.send(jsonutil.dumps(config))
         return ws
 
     async def send_message(self, ws, payload: dict[str, Any]):
         """Send a JSON payload over the websocket"""
-        await ws.send(json.dumps(payload))
+        await ws.send(jsonutil.dumps(payload))
 
     def get_provider_tools(self) -> list[dict]:
         # XAI server-side tools
@@ -1,12 +1,40 @@
-import base64
-import json
+import contextlib
+import functools
+import re
+import socket
+import ssl
+import sys
 from abc import ABC, abstractmethod
+from binascii import a2b_base64
 from typing import Any, Optional
 
-import websockets.asyncio.client
+import websockets.exceptions
+
+from . import jsonutil
+
+
+# Event types _collect_audio_response acts on, as they appear in the raw frame
+_COLLECT_EVENT_RE = re.compile(rb'"response\.(?:output_audio(?:\.delta)?|done)"')
+
+
+@functools.cache
+def _ssl_context() -> ssl.SSLContext:
+    """Shared client TLS context for the realtime websockets.
+
+    Without one, asyncio builds a fresh default context (re-reading the CA
+    bundle) for every wss connection, i.e. for every generated clip.
+    """
+    return ssl.create_default_context()
+
+
+# Linux-only socket option for holding back partial TCP segments
+_TCP_CORK = getattr(socket, "TCP_CORK", None)
 
 
 class RealtimeAIProvider(ABC):
+    # Empty so subclasses that declare their own __slots__ get no __dict__
+    __slots__ = ()
+
     @abstractmethod
     async def generate_audio_clip(
         self,
@@ -51,9 +79,44 @@ class RealtimeAIProvider(ABC):
 
     async def _connect_websocket(self):
         """Connect to the provider's websocket and return the connection (without config)"""
+        # Imported on first connect: the client pulls in the frame codec and
+        # compression modules, which text-only and web config code paths never need
+        from websockets.asyncio.client import connect
+
         uri = self._get_websocket_uri()
         headers = self._get_headers()
-        return await websockets.asyncio.client.connect(uri, additional_headers=headers)
+        # No permessage-deflate: the traffic is mostly base64 PCM, which barely
+        # compresses, so deflate would only cost an inflate/deflate per frame
+        return await connect(
+            uri,
+            additional_headers=headers,
+            compression=None,
+            ssl=_ssl_context() if uri.startswith("wss://") else None,
+        )
+
+    async def _send_batch(self, ws, messages):
+        """Send several frames back to back, coalesced into as few TCP segments as possible.
+
+        The socket is corked while the frames are written (where the OS supports
+        it), so small setup messages don't each go out as their own packet.
+        """
+        sock = None
+        if _TCP_CORK is not None:
+            transport = getattr(ws, "transport", None)
+            sock = transport.get_extra_info("socket") if transport else None
+        if sock is not None:
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, _TCP_CORK, 1)
+            except OSError:
+                sock = None
+        try:
+            for message in messages:
+                await ws.send(message)
+        finally:
+            if sock is not None:
+                # Uncorking flushes whatever is still held back
+                with contextlib.suppress(OSError):
+                    sock.setsockopt(socket.IPPROTO_TCP, _TCP_CORK, 0)
 
     @abstractmethod
     async def connect(
@@ -69,27 +132,46 @@ class RealtimeAIProvider(ABC):
 
     async def _collect_audio_response(self, ws):
         """Helper method to collect audio data from websocket response"""
-        audio_bytes = bytearray()
-        async for message in ws:
-            data = json.loads(message)
+        # Decoded deltas are joined once at the end (one copy) rather than grown
+        # into a bytearray and copied again into bytes
+        chunks: list[bytes] = []
+        while True:
+            try:
+                # Raw frame bytes: skips websockets' UTF-8 decode of every
+                # (mostly base64) frame; the JSON parser takes bytes directly
+                message = await ws.recv(decode=False)
+            except websockets.exceptions.ConnectionClosedOK:
+                break
+            # Skip frames that can't be audio or response.done (transcript
+            # deltas, item/response lifecycle events) without parsing them; a
+            # false match only costs the parse below
+            if not _COLLECT_EVENT_RE.search(message):
+                continue
+            data = jsonutil.loads(message)
             t = data.get("type") or ""
             if t in {"response.output_audio", "response.output_audio.delta"}:
                 b64 = data.get("audio") or data.get("delta")
                 if b64:
-                    audio_bytes.extend(base64.b64decode(b64))
+                    # a2b_base64 takes the ASCII str as-is (b64decode would
+                    # encode it to bytes first, then call this same decoder)
+                    chunks.append(a2b_base64(b64))
             elif t == "response.done":
                 break
-        return bytes(audio_bytes)
+        return b"".join(chunks)
 
 
 class RealtimeAIProviderRegistry:
+    __slots__ = ("providers", "default_provider")
+
     def __init__(self):
         self.providers: dict[str, RealtimeAIProvider] = {}
         self.default_provider: Optional[str] = None
 
     def register_provider(self, provider: RealtimeAIProvider):
         """Register a realtime AI provider"""
-        name = provider.get_provider_name()
+        # Names are interned so the default-provider lookup in get_provider hits
+        # the dict key by identity
+        name = sys.intern(provider.get_provider_name())
         self.providers[name] = provider
         if self.default_provider is None:
             self.default_provider = name
@@ -110,7 +192,9 @@ class RealtimeAIProviderRegistry:
         """Set the default realtime AI provider"""
         if name not in self.providers:
             raise ValueError(f"Realtime AI provider '{name}' not found")
-        self.default_provider = name
+        # The name usually comes from config (REALTIME_AI_PROVIDER); store the
+        # interned copy, the same object as the registered key
+        self.default_provider = sys.intern(name)
 
 
 # Global registry instance
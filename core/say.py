@@ -1,11 +1,16 @@
+import re
 from typing import Literal, Optional
 
 
+# "{{ ... }}" (ignoring surrounding whitespace) marks a prompt instead of literal text
+_PROMPT_RE = re.compile(r"\s*\{\{(.*)\}\}\s*", re.DOTALL)
+
+
 def _classify_kind(text: str) -> tuple[Literal["prompt", "literal", "raw"], str]:
-    s = text.strip()
-    if s.startswith("{{") and s.endswith("}}"):
-        return "prompt", s[2:-2].strip()
-    return "literal", s
+    m = _PROMPT_RE.fullmatch(text)
+    if m:
+        return "prompt", m.group(1).strip()
+    return "literal", text.strip()
 
 
 async def say(text: str, *, interactive: Optional[bool] = None):
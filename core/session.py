@@ -1,16 +1,16 @@
 import asyncio
-import base64
 import json
 import os
 import socket
 import time
+from binascii import a2b_base64
 from datetime import datetime
 from typing import Any
 
 import numpy as np
 import websockets.exceptions
 
-from . import audio
+from . import audio, jsonutil
 from .base_tools import get_base_tools, get_user_tools
 from .config import (
     CHUNK_MS,
@@ -345,7 +345,7 @@ class BillySession:
         self._turn_had_speech = True
         audio_b64 = data.get("audio") or data.get("delta")
         if audio_b64:
-            audio_chunk = base64.b64decode(audio_b64)
+            audio_chunk = a2b_base64(audio_b64)
             self.audio_buffer.extend(audio_chunk)
             self.last_activity[0] = time.time()
             audio.playback_queue.put(audio_chunk)
@@ -1151,7 +1151,7 @@ class BillySession:
                     print("🚪 Session marked as inactive, stopping stream loop.")
                     print()  # Add newline to end the mic volume display line
                     break
-                data = json.loads(message)
+                data = jsonutil.loads(message)
                 if DEBUG_MODE and (
                     DEBUG_MODE_INCLUDE_DELTA
                     or not (data.get("type") or "").endswith("delta")
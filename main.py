@@ -1,3 +1,4 @@
+import asyncio
 import shutil
 import signal
 import sys
@@ -48,6 +49,11 @@ from core.viz import start_viz, stop_viz
 current_level = reload_log_level()
 print(f"🔧 Log level set to: {current_level.name}")
 
+try:
+    import uvloop
+except ImportError:  # optional speedup; asyncio's default event loop is used
+    uvloop = None
+
 
 def signal_handler(sig, frame):
     logger.info("Exiting cleanly (signal received).", "👋")
@@ -63,6 +69,12 @@ def main():
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
+    # Sessions, MQTT "say" and other coroutines each run in their own
+    # asyncio.run(); setting the policy once here makes all of them use uvloop
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.verbose("Using uvloop event loop")
+
     # Load default user profile BEFORE starting button loop
     # This ensures the persona manager is set to the correct persona before any sessions start
     from core.profile_manager import user_manager
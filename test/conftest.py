@@ -0,0 +1,9 @@
+import os
+import sys
+
+
+# Make the repo root importable when pytest is run from anywhere
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Importing core registers the realtime providers, which needs an API key
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
@@ -0,0 +1,104 @@
+import configparser
+
+import pytest
+
+from core.persona_manager import PersonaManager
+
+
+PERSONA_INI = """[META]
+name = Foo
+description = Foo persona
+voice = ash
+
+[PERSONALITY]
+humor = 80
+"""
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    # PersonaManager works with paths relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "persona.ini").write_text(PERSONA_INI)
+    (tmp_path / "personas" / "foo").mkdir(parents=True)
+    (tmp_path / "personas" / "foo" / "persona.ini").write_text(PERSONA_INI)
+    (tmp_path / "persona_presets" / "billy-bauhaus").mkdir(parents=True)
+    (tmp_path / "persona_presets" / "billy-bauhaus" / "persona.ini").write_text(
+        PERSONA_INI
+    )
+    return PersonaManager()
+
+
+def test_switch_persona(manager):
+    assert manager.switch_persona("foo")
+    assert manager.current_persona == "foo"
+    assert not manager.switch_persona("missing")
+    assert manager.current_persona == "foo"
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["../persona_presets/billy-bauhaus", "..", "foo/..", "/etc", "", "foo/../foo"],
+)
+def test_switch_persona_rejects_path_traversal(manager, name):
+    assert not manager.switch_persona(name)
+    assert manager.current_persona == "default"
+
+
+def test_recreating_persona_from_preset_refreshes_listing(manager, tmp_path):
+    preset_dir = tmp_path / "persona_presets" / "billy-bro"
+    preset_dir.mkdir()
+    (preset_dir / "persona.ini").write_text(
+        PERSONA_INI.replace("Foo persona", "Bro persona")
+    )
+
+    assert manager.create_persona_from_preset("billy-bauhaus", "baz")
+    assert {"name": "baz", "description": "Foo persona"} in (
+        manager.get_available_personas()
+    )
+    assert manager.load_persona("baz")["meta"]["description"] == "Foo persona"
+
+    assert manager.create_persona_from_preset("billy-bro", "baz")
+    assert {"name": "baz", "description": "Bro persona"} in (
+        manager.get_available_personas()
+    )
+    assert manager.load_persona("baz")["meta"]["description"] == "Bro persona"
+
+
+def test_listing_picks_up_in_place_edits(manager, tmp_path):
+    assert {"name": "foo", "description": "Foo persona"} in (
+        manager.get_available_personas()
+    )
+
+    persona_file = tmp_path / "personas" / "foo" / "persona.ini"
+    persona_file.write_text(PERSONA_INI.replace("Foo persona", "Edited persona"))
+
+    assert {"name": "foo", "description": "Edited persona"} in (
+        manager.get_available_personas()
+    )
+
+
+def test_percent_values_round_trip(manager, tmp_path):
+    # The web UI and config writers save persona files with ConfigParser, which
+    # only accepts a literal % escaped as %%; readers must unescape it
+    config = configparser.ConfigParser()
+    config["META"] = {
+        "description": "100%% fish",
+        "instructions": "Be 50%% sarcastic",
+    }
+    config["BACKSTORY"] = {"origin": "Caught at 5%% battery"}
+    with open(tmp_path / "personas" / "foo" / "persona.ini", "w") as f:
+        config.write(f)
+
+    persona = manager.load_persona("foo")
+    assert persona["meta"]["description"] == "100% fish"
+    assert persona["backstory"]["origin"] == "Caught at 5% battery"
+    assert manager.get_persona_instructions("foo") == "Be 50% sarcastic"
+    assert {"name": "foo", "description": "100% fish"} in (
+        manager.get_available_personas()
+    )
+
+    assert manager.create_persona_from_preset(
+        "billy-bauhaus", "baz", display_name="Billy 100%"
+    )
+    assert manager.load_persona("baz")["meta"]["name"] == "Billy 100%"
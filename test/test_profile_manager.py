@@ -0,0 +1,129 @@
+import os
+
+import pytest
+
+from core import config
+from core.profile_manager import MAX_CORE_MEMORIES, UserProfile, UserProfileManager
+
+
+@pytest.fixture
+def profiles_dir(tmp_path, monkeypatch):
+    # Profiles live in profiles/ relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "profiles").mkdir()
+    return tmp_path / "profiles"
+
+
+def test_reload_sees_same_size_rewrite_within_one_mtime(profiles_dir):
+    UserProfile("Alice")  # creates the file
+    # Loading parses the file and caches the result for this file version
+    assert UserProfile("Alice").data["USER_INFO"]["interaction_count"] == "0"
+    path = profiles_dir / "alice.ini"
+    st = os.stat(path)
+
+    # Same size, same mtime, but a new file (as every save's os.replace makes)
+    tmp = profiles_dir / "alice.ini.tmp"
+    tmp.write_text(
+        path.read_text().replace("interaction_count = 0", "interaction_count = 7")
+    )
+    os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.replace(tmp, path)
+    assert os.stat(path).st_size == st.st_size
+
+    assert UserProfile("Alice").data["USER_INFO"]["interaction_count"] == "7"
+
+
+def test_setters_write_and_sync_immediately(profiles_dir):
+    profile = UserProfile("Alice")
+    profile.flush_to_disk()
+
+    profile.set_preferred_persona("bro")
+    profile.set_display_name("Al")
+
+    assert not profile._unsynced
+    reloaded = UserProfile("Alice").data["USER_INFO"]
+    assert reloaded["preferred_persona"] == "bro"
+    assert reloaded["display_name"] == "Al"
+
+
+def test_memories_are_stored_as_ascii_json(profiles_dir):
+    profile = UserProfile("Alice")
+    profile.add_memory("Likes the café 🐟")
+
+    raw = (profiles_dir / "alice.ini").read_bytes()
+    assert raw.isascii()
+    assert UserProfile("Alice").get_memories()[0]["memory"] == "Likes the café 🐟"
+
+
+def test_save_rejects_values_configparser_cannot_read_back(profiles_dir):
+    profile = UserProfile("Alice")
+    with pytest.raises(ValueError):
+        profile.set_display_name("50% Al")
+    assert UserProfile("Alice").data["USER_INFO"]["display_name"] == "Alice"
+
+
+def test_field_update_replaces_whole_multiline_value(profiles_dir):
+    UserProfile("Alice")
+    path = profiles_dir / "alice.ini"
+    path.write_text(
+        path.read_text().replace(
+            "display_name = Alice", "display_name = Al\n\tthe Great"
+        )
+    )
+    profile = UserProfile("Alice")
+    assert profile.data["USER_INFO"]["display_name"] == "Al\nthe Great"
+
+    profile.set_display_name("Bob")
+
+    reloaded = UserProfile("Alice").data["USER_INFO"]
+    assert reloaded["display_name"] == "Bob"
+    assert (
+        reloaded["preferred_persona"] == profile.data["USER_INFO"]["preferred_persona"]
+    )
+
+
+def test_memories_keep_most_important_and_newest(profiles_dir):
+    profile = UserProfile("Alice")
+    profile.add_memory("high", importance="high")
+    for i in range(MAX_CORE_MEMORIES + 2):
+        profile.add_memory(f"low {i}", importance="low")
+    profile.add_memory("medium", importance="medium")
+
+    saved = UserProfile("Alice").get_memories(limit=MAX_CORE_MEMORIES + 5)
+    memories = [m["memory"] for m in saved]
+    assert len(memories) == MAX_CORE_MEMORIES
+    # Ordered by importance, oldest first within a level; the oldest lows dropped
+    low_kept = [f"low {i}" for i in range(4, MAX_CORE_MEMORIES + 2)]
+    assert memories == low_kept + ["medium", "high"]
+
+
+def test_flush_to_disk_syncs_directory_once(profiles_dir, monkeypatch):
+    profile = UserProfile("Alice")
+    profile.flush_to_disk()
+    synced = []
+    real_fsync = os.fsync
+
+    def fsync(fd):
+        synced.append(os.fstat(fd).st_ino)
+        real_fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", fsync)
+
+    profile.add_memory("Likes fish")  # saves without syncing the directory
+    assert profile._unsynced
+    profile.flush_to_disk()
+    profile.flush_to_disk()
+
+    assert not profile._unsynced
+    assert synced.count(os.stat(profiles_dir).st_ino) == 1
+
+
+def test_guest_mode_startup_makes_guest_the_current_user(profiles_dir, monkeypatch):
+    monkeypatch.setattr(config, "DEFAULT_USER", "guest")
+    manager = UserProfileManager()
+
+    manager.load_default_user()
+
+    assert manager.current_user is not None
+    assert manager.current_user.name == "Guest"
+    assert (profiles_dir / "guest.ini").exists()
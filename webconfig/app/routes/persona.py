@@ -185,7 +185,7 @@ def save_persona():
 
     # Ensure the personas directory exists
     if persona_name != "default":
-        persona_file.parent.mkdir(exist_ok=True)
+        persona_file.parent.mkdir(parents=True, exist_ok=True)
 
     with open(persona_file, "w") as f:
         config.write(f)
@@ -224,7 +224,7 @@ def save_single_wakeup_phrase():
         personas_dir = Path("personas")
         persona_file = personas_dir / current_persona / "persona.ini"
         # Ensure the directory exists
-        persona_file.parent.mkdir(exist_ok=True)
+        persona_file.parent.mkdir(parents=True, exist_ok=True)
 
     config = configparser.ConfigParser()
     config.read(persona_file)
@@ -311,7 +311,7 @@ def import_persona_by_name(persona_name):
 
             personas_dir = PROJECT_ROOT / "personas"
             target_file = personas_dir / persona_name / "persona.ini"
-            target_file.parent.mkdir(exist_ok=True)
+            target_file.parent.mkdir(parents=True, exist_ok=True)
 
         # Write the imported content
         with open(target_file, 'w') as f:
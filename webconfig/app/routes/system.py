@@ -336,8 +336,7 @@ def update_current_user_profile():
             new_persona = data.get("preferred_persona")
             if new_persona:
                 # Update user's preferred persona
-                current_user.data['USER_INFO']['preferred_persona'] = new_persona
-                current_user._save_profile()
+                current_user.set_preferred_persona(new_persona)
 
                 # Switch persona manager to new persona
                 persona_manager.switch_persona(new_persona)